@@ -5,14 +5,6 @@ cryoDL - Python Wrapper for Cryo-EM Deep Learning Software Packages
 import os
 from pathlib import Path
 
-try:
-    import tomllib  # Python 3.11+
-except ImportError:
-    import tomli as tomllib  # Python < 3.11
-
-from .config_manager import ConfigManager
-from .cli import CryoDLShell
-
 
 def _get_version_from_pyproject():
     """Get version from pyproject.toml file."""
@@ -22,6 +14,11 @@ def _get_version_from_pyproject():
         pyproject_path = project_root / "pyproject.toml"
 
         if pyproject_path.exists():
+            try:
+                import tomllib  # Python 3.11+
+            except ImportError:
+                import tomli as tomllib  # Python < 3.11
+
             with open(pyproject_path, "rb") as f:
                 data = tomllib.load(f)
                 return data["project"]["version"]
@@ -43,3 +40,16 @@ except importlib.metadata.PackageNotFoundError:
 __author__ = "Nathan Levinzon & Shen Lab Team @ The University of Utah"
 
 __all__ = ["ConfigManager", "CryoDLShell"]
+
+
+def __getattr__(name):
+    """Import the public classes on first access so `cryodl --help` stays cheap."""
+    if name == "ConfigManager":
+        from .config_manager import ConfigManager
+
+        return ConfigManager
+    if name == "CryoDLShell":
+        from .cli import CryoDLShell
+
+        return CryoDLShell
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
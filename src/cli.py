@@ -3,20 +3,55 @@
 Interactive CLI shell for cryoDL - Python Wrapper for Cryo-EM Deep Learning Software Packages
 """
 
-import argparse
 import cmd
 import datetime
 import logging
 import subprocess
 import os
+import random
 import sys
+import tempfile
 import traceback
 import readline
 import glob
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from .config_manager import ConfigManager
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
+
+_DESCRIPTION = "cryoDL Interactive Configuration Manager"
+
+_EPILOG = """
+Examples:
+  cryodl                    # Start interactive shell
+  cryodl --log-file my.log  # Use custom log file
+        """
+
+
+def _build_parser():
+    """Build the command-line parser for main().
+
+    argparse is only imported here, so the common invocations that main()
+    recognises directly never pay for it.
+
+    Returns:
+        argparse.ArgumentParser: Parser for the cryodl command line.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
+    )
+
+    parser.add_argument(
+        "--log-file",
+        default="cryodl.log",
+        help="Log file path (default: cryodl.log)",
+    )
+    return parser
 
 
 class CryoDLShell(cmd.Cmd):
@@ -35,7 +70,44 @@ class CryoDLShell(cmd.Cmd):
 
     prompt = "cryoDL> "
 
-    def __init__(self, config_manager: ConfigManager, log_file: str = "cryodl.log"):
+    # (name, prompt, default, validator, error message) for topaz cross setup
+    _TOPAZ_CROSS_PROMPTS = (
+        (
+            "output_dir",
+            "Enter output directory name (default: topaz_cross_output): ",
+            "topaz_cross_output",
+        ),
+        (
+            "pixel_size",
+            "Enter pixel size for downsampling in Å/px (default: 8): ",
+            "8",
+            float,
+            "Pixel size must be a number",
+        ),
+        (
+            "test_micrographs",
+            "Enter number of test micrographs to hold out (default: 10): ",
+            "10",
+            int,
+            "Number of test micrographs must be a number",
+        ),
+        (
+            "k_folds",
+            "Enter number of folds for cross-validation (default: 5): ",
+            "5",
+            int,
+            "Number of folds must be a number",
+        ),
+        (
+            "n_values",
+            "Enter N values for cross-validation (comma-separated, default: 250,300,350,400,450,500): ",
+            "250,300,350,400,450,500",
+            lambda text: [int(x) for x in text.split(",")],
+            "N values must be comma-separated numbers",
+        ),
+    )
+
+    def __init__(self, config_manager: "ConfigManager", log_file: str = "cryodl.log"):
         """Initialize the CryoDLShell.
 
         Sets up the interactive shell with configuration management, logging,
@@ -48,7 +120,7 @@ class CryoDLShell(cmd.Cmd):
                 interactions. Defaults to "cryodl.log".
 
         Example:
-            config_manager = ConfigManager()
+            config_manager = ConfigManager.shared()
             shell = CryoDLShell(config_manager, "my_session.log")
         """
         super().__init__()
@@ -327,7 +399,7 @@ All interactions are logged to cryodl.log in the current directory.
 
         # Log session start
         self.logger.info("=== cryoDL Interactive Session Started ===")
-        self.logger.info(f"Working directory: {os.getcwd()}")
+        self.logger.info("Working directory: %s", os.getcwd())
 
     def log_command(self, command: str, args: str = ""):
         """Log user command.
@@ -343,8 +415,8 @@ All interactions are logged to cryodl.log in the current directory.
             shell.log_command("get", "settings.max_threads")
             # Logs: "Command: get settings.max_threads"
         """
-        full_command = f"{command} {args}".strip()
-        self.logger.info(f"Command: {full_command}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Command: %s", f"{command} {args}".strip())
 
     def log_output(self, output: str):
         """Log command output.
@@ -358,8 +430,9 @@ All interactions are logged to cryodl.log in the current directory.
             shell.log_output("Configuration loaded successfully")
             # Logs: "Output: Configuration loaded successfully"
         """
-        if output.strip():
-            self.logger.info(f"Output: {output.strip()}")
+        output = output.strip()
+        if output:
+            self.logger.info("Output: %s", output)
 
     def log_error(self, error: str):
         """Log error messages.
@@ -373,7 +446,7 @@ All interactions are logged to cryodl.log in the current directory.
             shell.log_error("Configuration file not found")
             # Logs: "Error: Configuration file not found"
         """
-        self.logger.error(f"Error: {error}")
+        self.logger.error("Error: %s", error)
 
     def do_init(self, arg):
         """Initialize default configuration.
@@ -580,8 +653,8 @@ All interactions are logged to cryodl.log in the current directory.
         try:
             output = "\nDependency Path Validation:\n" + "-" * 40 + "\n"
             all_valid = True
-            for dep_name in self.config_manager.config["dependencies"]:
-                is_valid = self.config_manager.validate_dependency_path(dep_name)
+            validity = self.config_manager.validate_all_dependency_paths()
+            for dep_name, is_valid in validity.items():
                 status = "✓ Valid" if is_valid else "✗ Invalid"
                 path = self.config_manager.config["dependencies"][dep_name].get(
                     "path", "Not set"
@@ -1186,11 +1259,7 @@ All interactions are logged to cryodl.log in the current directory.
                 return
 
             # Validate FASTA file exists
-            fasta_path = Path(fasta_file)
-            if not fasta_path.is_absolute():
-                fasta_path = Path.cwd() / fasta_file
-
-            if not fasta_path.exists():
+            if not os.path.isfile(fasta_file):
                 error_msg = f"FASTA file not found: {fasta_file}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
@@ -1210,8 +1279,6 @@ All interactions are logged to cryodl.log in the current directory.
                 self.log_output(output)
 
                 # Execute the command
-                import subprocess
-
                 try:
                     result = subprocess.run(
                         model_angelo_cmd, shell=True, capture_output=True, text=True
@@ -1314,8 +1381,6 @@ echo "ModelAngelo job completed"
                 # Submit job
 
                 try:
-                    import subprocess
-
                     result = subprocess.run(
                         f"sbatch {slurm_script_path}",
                         shell=True,
@@ -1466,8 +1531,7 @@ echo "ModelAngelo job completed"
                 return
 
             # Validate micrographs directory exists
-            micrographs_path = Path(raw_micrographs)
-            if not micrographs_path.exists():
+            if not os.path.isdir(raw_micrographs):
                 error_msg = f"Micrographs directory not found: {raw_micrographs}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
@@ -1477,10 +1541,8 @@ echo "ModelAngelo job completed"
             raw_particles = input(
                 "Enter path to particle coordinates file (optional, press Enter to skip): "
             ).strip()
-            particles_path = None
             if raw_particles:
-                particles_path = Path(raw_particles)
-                if not particles_path.exists():
+                if not os.path.isfile(raw_particles):
                     error_msg = f"Particle coordinates file not found: {raw_particles}"
                     print(error_msg, file=sys.stderr)
                     self.log_error(error_msg)
@@ -1519,7 +1581,7 @@ echo "ModelAngelo job completed"
 
             # Build convert command if particles file provided
             convert_cmd = None
-            if particles_path:
+            if raw_particles:
                 convert_cmd = f"{topaz_path} convert -s {pixel_size} -o {proc_root}/particles.txt {raw_particles}"
 
             if is_local:
@@ -1535,8 +1597,6 @@ echo "ModelAngelo job completed"
                 data_dir.mkdir(parents=True, exist_ok=True)
 
                 # Execute preprocess command
-                import subprocess
-
                 try:
                     result = subprocess.run(
                         preprocess_cmd, shell=True, capture_output=True, text=True
@@ -1618,7 +1678,7 @@ srun -u {topaz_path} preprocess -v -s {pixel_size} \\
 """
 
                 # Add convert command if particles file provided
-                if particles_path:
+                if raw_particles:
                     slurm_script += f"""
 # Scale particle coordinates to match downsampling
 srun -u {topaz_path} convert -s {pixel_size} \\
@@ -1639,7 +1699,7 @@ echo "Topaz preprocess job completed"
                 print(f"\nJob Summary:")
                 print(f"  Job Name: {job_name}")
                 print(f"  Raw Micrographs: {raw_micrographs}")
-                if particles_path:
+                if raw_particles:
                     print(f"  Particle Coordinates: {raw_particles}")
                 print(f"  Output Directory: {output_dir}")
                 print(f"  Pixel Size: {pixel_size} Å/px")
@@ -1667,8 +1727,6 @@ echo "Topaz preprocess job completed"
 
                 # Submit job
                 try:
-                    import subprocess
-
                     result = subprocess.run(
                         f"sbatch {slurm_script_path}",
                         shell=True,
@@ -1726,8 +1784,7 @@ echo "Topaz preprocess job completed"
                 return
 
             # Validate movies directory exists
-            movies_path = Path(raw_movies)
-            if not movies_path.exists():
+            if not os.path.isdir(raw_movies):
                 error_msg = f"Movie frames directory not found: {raw_movies}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
@@ -1927,8 +1984,7 @@ visualize_denoising_results(
                 return
 
             # Validate micrographs directory exists
-            micrographs_path = Path(proc_micrographs)
-            if not micrographs_path.exists():
+            if not os.path.isdir(proc_micrographs):
                 error_msg = f"Preprocessed micrographs directory not found: {proc_micrographs}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
@@ -1943,8 +1999,7 @@ visualize_denoising_results(
                 return
 
             # Validate particles file exists
-            particles_path = Path(particles_file)
-            if not particles_path.exists():
+            if not os.path.isfile(particles_file):
                 error_msg = f"Particle coordinates file not found: {particles_file}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
@@ -2019,8 +2074,6 @@ visualize_denoising_results(
                 print(f"Training command: {train_cmd}")
 
                 # Execute training command
-                import subprocess
-
                 try:
                     result = subprocess.run(
                         train_cmd, shell=True, capture_output=True, text=True
@@ -2140,8 +2193,6 @@ echo "Topaz model training job completed"
 
                 # Submit job
                 try:
-                    import subprocess
-
                     result = subprocess.run(
                         f"sbatch {slurm_script_path}",
                         shell=True,
@@ -2173,6 +2224,31 @@ echo "Topaz model training job completed"
             print(error_msg, file=sys.stderr)
             self.log_error(error_msg)
 
+    def _prompt_with_default(self, prompt, default, cast=None, error_msg=""):
+        """Prompt for a value, falling back to a default and parsing it.
+
+        Args:
+            prompt (str): The input prompt.
+            default (str): Text used when the user just presses Enter.
+            cast (callable, optional): Parser applied to the entered (or
+                default) text; it must raise ValueError for invalid input.
+            error_msg (str, optional): Message reported when parsing fails.
+
+        Returns:
+            The parsed value (the text itself when no cast is given), or None
+            if parsing failed.
+        """
+        value = input(prompt).strip() or default
+        if cast is None:
+            return value
+
+        try:
+            return cast(value)
+        except ValueError:
+            print(error_msg, file=sys.stderr)
+            self.log_error(error_msg)
+            return None
+
     def _run_topaz_cross(self, topaz_path, is_local):
         """Run Topaz cross-validation command.
 
@@ -2199,8 +2275,7 @@ echo "Topaz model training job completed"
                 return
 
             # Validate micrographs directory exists
-            micrographs_path = Path(raw_micrographs)
-            if not micrographs_path.exists():
+            if not os.path.isdir(raw_micrographs):
                 error_msg = f"Micrographs directory not found: {raw_micrographs}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
@@ -2214,79 +2289,26 @@ echo "Topaz model training job completed"
                 self.log_error(error_msg)
                 return
 
-            particles_path = Path(raw_particles)
-            if not particles_path.exists():
+            if not os.path.isfile(raw_particles):
                 error_msg = f"Particle coordinates file not found: {raw_particles}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
                 return
 
-            # Get output directory
-            output_dir = input(
-                "Enter output directory name (default: topaz_cross_output): "
-            ).strip()
-            if not output_dir:
-                output_dir = "topaz_cross_output"
-
-            # Get pixel size for downsampling
-            pixel_size = input(
-                "Enter pixel size for downsampling in Å/px (default: 8): "
-            ).strip()
-            if not pixel_size:
-                pixel_size = "8"
-            else:
-                try:
-                    float(pixel_size)  # Validate it's a number
-                except ValueError:
-                    error_msg = "Pixel size must be a number"
-                    print(error_msg, file=sys.stderr)
-                    self.log_error(error_msg)
+            # Prompt for the remaining parameters, validating each as it is read
+            params = {}
+            for name, prompt, default, *parse in self._TOPAZ_CROSS_PROMPTS:
+                value = self._prompt_with_default(prompt, default, *parse)
+                if value is None:
                     return
+                params[name] = value
 
-            # Get number of test micrographs to hold out
-            test_micrographs = input(
-                "Enter number of test micrographs to hold out (default: 10): "
-            ).strip()
-            if not test_micrographs:
-                test_micrographs = "10"
-            else:
-                try:
-                    int(test_micrographs)  # Validate it's a number
-                except ValueError:
-                    error_msg = "Number of test micrographs must be a number"
-                    print(error_msg, file=sys.stderr)
-                    self.log_error(error_msg)
-                    return
-
-            # Get number of folds for cross-validation
-            k_folds = input(
-                "Enter number of folds for cross-validation (default: 5): "
-            ).strip()
-            if not k_folds:
-                k_folds = "5"
-            else:
-                try:
-                    int(k_folds)  # Validate it's a number
-                except ValueError:
-                    error_msg = "Number of folds must be a number"
-                    print(error_msg, file=sys.stderr)
-                    self.log_error(error_msg)
-                    return
-
-            # Get N values for cross-validation (comma-separated)
-            n_values_input = input(
-                "Enter N values for cross-validation (comma-separated, default: 250,300,350,400,450,500): "
-            ).strip()
-            if not n_values_input:
-                n_values = [250, 300, 350, 400, 450, 500]
-            else:
-                try:
-                    n_values = [int(x.strip()) for x in n_values_input.split(",")]
-                except ValueError:
-                    error_msg = "N values must be comma-separated numbers"
-                    print(error_msg, file=sys.stderr)
-                    self.log_error(error_msg)
-                    return
+            output_dir = params["output_dir"]
+            # Keep whole pixel sizes as e.g. "8" in the topaz commands
+            pixel_size = f"{params['pixel_size']:g}"
+            test_micrographs = params["test_micrographs"]
+            k_folds = params["k_folds"]
+            n_values = params["n_values"]
 
             # Create output directories
             proc_root = Path(output_dir)
@@ -2315,33 +2337,42 @@ echo "Topaz model training job completed"
                 cross_dir.mkdir(parents=True, exist_ok=True)
 
                 # Execute commands
-                import subprocess
-
                 try:
                     # Step 1: Preprocess
+                    # Steps 1 and 2 are independent, so run them concurrently and
+                    # only pay for one topaz start-up before the split
                     print("\nStep 1: Preprocessing micrographs...")
-                    result = subprocess.run(
-                        preprocess_cmd, shell=True, capture_output=True, text=True
-                    )
-                    if result.returncode != 0:
-                        error_msg = f"Topaz preprocess failed with return code {result.returncode}"
-                        print(error_msg, file=sys.stderr)
-                        print(f"Error output: {result.stderr}", file=sys.stderr)
-                        self.log_error(error_msg)
-                        return
-
-                    # Step 2: Convert particle coordinates
                     print("Step 2: Converting particle coordinates...")
-                    result = subprocess.run(
-                        convert_cmd, shell=True, capture_output=True, text=True
-                    )
-                    if result.returncode != 0:
-                        error_msg = (
-                            f"Topaz convert failed with return code {result.returncode}"
+                    # stderr goes to temporary files rather than pipes: a step
+                    # that fills its pipe while the other one is being waited
+                    # on would otherwise block
+                    procs = []
+                    for step, command in (
+                        ("preprocess", preprocess_cmd),
+                        ("convert", convert_cmd),
+                    ):
+                        errors = tempfile.TemporaryFile(mode="w+")
+                        proc = subprocess.Popen(
+                            command,
+                            shell=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=errors,
                         )
-                        print(error_msg, file=sys.stderr)
-                        print(f"Error output: {result.stderr}", file=sys.stderr)
-                        self.log_error(error_msg)
+                        procs.append((step, proc, errors))
+
+                    failed = False
+                    for step, proc, errors in procs:
+                        proc.wait()
+                        with errors:
+                            errors.seek(0)
+                            stderr = errors.read()
+                        if proc.returncode != 0:
+                            error_msg = f"Topaz {step} failed with return code {proc.returncode}"
+                            print(error_msg, file=sys.stderr)
+                            print(f"Error output: {stderr}", file=sys.stderr)
+                            self.log_error(error_msg)
+                            failed = True
+                    if failed:
                         return
 
                     # Step 3: Train-test split
@@ -2359,7 +2390,7 @@ echo "Topaz model training job completed"
                     # Step 4: Cross-validation training
                     print("Step 4: Running cross-validation training...")
                     for n in n_values:
-                        for fold in range(int(k_folds)):
+                        for fold in range(k_folds):
                             train_cmd = f"{topaz_path} train -n {n} --num-workers=8 --train-images {proc_root}/image_list_train.txt --train-targets {proc_root}/particles_train.txt -k {k_folds} --fold {fold} -o {cross_dir}/model_n{n}_fold{fold}_training.txt"
                             print(f"Training model with N={n}, fold={fold}...")
                             result = subprocess.run(
@@ -2500,8 +2531,6 @@ echo "Topaz cross-validation job completed"
 
                 # Submit job
                 try:
-                    import subprocess
-
                     result = subprocess.run(
                         f"sbatch {slurm_script_path}",
                         shell=True,
@@ -2582,8 +2611,7 @@ echo "Topaz cross-validation job completed"
                 k_folds = int(k_folds_input) if k_folds_input else 5
 
             # Validate inputs
-            cv_path = Path(cv_dir)
-            if not cv_path.exists():
+            if not os.path.isdir(cv_dir):
                 error_msg = f"Cross-validation directory not found: {cv_dir}"
                 print(error_msg, file=sys.stderr)
                 self.log_error(error_msg)
@@ -2804,8 +2832,6 @@ echo "Topaz cross-validation job completed"
                 with open(quotes_path, "r", encoding="utf-8") as f:
                     quotes = [line.strip() for line in f if line.strip()]
                 if quotes:
-                    import random
-
                     return random.choice(quotes)
             return None
         except Exception:
@@ -2965,28 +2991,29 @@ def main():
     Raises:
         SystemExit: On successful completion or error conditions.
     """
-    parser = argparse.ArgumentParser(
-        description="cryoDL Interactive Configuration Manager",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  cryodl                    # Start interactive shell
-  cryodl --log-file my.log  # Use custom log file
-        """,
-    )
-
-    parser.add_argument(
-        "--log-file", default="cryodl.log", help="Log file path (default: cryodl.log)"
-    )
-
-    args = parser.parse_args()
+    # Plain invocations are handled without argparse; anything else (help,
+    # abbreviations, values that look like options, unknown flags) goes
+    # through the parser so it is reported exactly as argparse would
+    argv = sys.argv[1:]
+    if not argv:
+        log_file = "cryodl.log"
+    elif len(argv) == 1 and argv[0].startswith("--log-file="):
+        log_file = argv[0].split("=", 1)[1]
+    elif len(argv) == 2 and argv[0] == "--log-file" and not argv[1].startswith("-"):
+        log_file = argv[1]
+    else:
+        log_file = _build_parser().parse_args(argv).log_file
 
     try:
         # Initialize config manager
-        config_manager = ConfigManager()
+        from .config_manager import ConfigManager
+
+        logging.basicConfig(level=logging.INFO)
+
+        config_manager = ConfigManager.shared()
 
         # Start interactive shell
-        shell = CryoDLShell(config_manager, args.log_file)
+        shell = CryoDLShell(config_manager, log_file)
         shell.cmdloop()
 
     except KeyboardInterrupt:
@@ -1,14 +1,269 @@
+import contextlib
+import copy
+import functools
 import json
 import os
 import sys
+import threading
+import types
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple, Union
 import logging
 
+# Use orjson for config (de)serialisation when it is installed, falling back
+# to the standard library otherwise. Both produce/accept UTF-8 bytes.
 try:
-    import tomllib
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    _loads = orjson.loads
 except ImportError:
-    import tomli as tomllib
+
+    def _dumps(obj: Any) -> bytes:
+        text = json.dumps(obj, indent=2, separators=(",", ": "))
+        return (text + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+_logger = logging.getLogger(__name__)
+
+# Serialised default configs keyed by their (paths, project_info) items; only
+# these sections vary between projects
+_DEFAULT_CONFIG_BYTES: Dict[Tuple[Tuple[Tuple[str, Any], ...], ...], bytes] = {}
+
+# Keys under "paths" whose directories create_default_config makes sure exist
+_CREATED_PATH_KEYS = ("output_dir", "temp_dir")
+
+# Default configuration sections that do not depend on the project location.
+# Frozen into a read-only view below, once it has been serialised.
+_STATIC_DEFAULTS: Mapping[str, Any] = {
+    "dependencies": {
+        "topaz": {
+            "path": "/uufs/chpc.utah.edu/sys/installdir/r8/topaz/0.3.7/bin/topaz",
+            "version": "3.0.7",
+            "enabled": True,
+        },
+        "model_angelo": {
+            "path": "/uufs/chpc.utah.edu/sys/installdir/model-angelo/1.0.1/bin/model_angelo",
+            "version": "1.0.1",
+            "enabled": True,
+        },
+    },
+    "settings": {
+        "max_threads": 4,
+        "memory_limit_gb": 16,
+        "gpu_enabled": False,
+        "debug_mode": False,
+        "log_level": "INFO",
+    },
+    "slurm": {
+        "job_name": "cryodl_job",
+        "nodes": 1,
+        "ntasks": 1,
+        "cpus_per_task": 4,
+        "gres_gpu": 1,
+        "time": "06:00:00",
+        "partition": "notchpeak-gpu",
+        "qos": "notchpeak-gpu",
+        "account": "notchpeak-gpu",
+        "mem": "96G",
+        "output": "slurm-%j.out-%N",
+        "error": "slurm-%j.err-%N",
+        "mail_type": "",
+        "mail_user": "",
+        "exclude": "",
+        "dependency": "",
+        "array": "",
+        "comment": "SLURM job configuration for cryoDL workflows",
+    },
+}
+
+# Pre-serialised copy of _STATIC_DEFAULTS; json.loads of this small blob is a
+# cheaper way to get a fresh, unaliased tree than copy.deepcopy. Keys are
+# sorted once here so fresh trees are already in canonical order.
+_STATIC_DEFAULTS_JSON = json.dumps(_STATIC_DEFAULTS, sort_keys=True)
+
+
+def _freeze(obj: Any) -> Any:
+    """Return a read-only view of ``obj`` with nested dicts wrapped as well."""
+    if isinstance(obj, dict):
+        return types.MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    return obj
+
+
+# A single immutable template shared by every ConfigManager, so the defaults
+# cannot be corrupted through a shared reference
+_STATIC_DEFAULTS = _freeze(_STATIC_DEFAULTS)
+
+
+def _fresh_static_defaults() -> Dict[str, Any]:
+    """Return a new, independent copy of the static default sections."""
+    return _loads(_STATIC_DEFAULTS_JSON)
+
+
+def _sort_tree(obj: Any) -> Any:
+    """Return ``obj`` with the keys of every nested dict in sorted order.
+
+    The config is kept in canonical key order in memory so that it can be
+    serialised without a sort_keys pass on every save.
+    """
+    if isinstance(obj, dict):
+        return {k: _sort_tree(obj[k]) for k in sorted(obj)}
+    if isinstance(obj, list):
+        return [_sort_tree(v) for v in obj]
+    return obj
+
+
+def _set_sorted(parent: Dict[str, Any], key: str, value: Any) -> None:
+    """Set ``parent[key]`` while keeping ``parent`` in sorted key order.
+
+    Existing keys are updated in place; only inserting a new key re-sorts
+    the parent dict.
+    """
+    if key in parent:
+        parent[key] = value
+        return
+    parent[key] = value
+    items = sorted(parent.items())
+    parent.clear()
+    parent.update(items)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` atomically.
+
+    The bytes are written and fsync'ed to a sibling temporary file which is
+    then renamed over ``path``, so readers never observe a partially written
+    file even if the process dies mid-write.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb", buffering=64 * 1024) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _list_dir(directory: Path) -> frozenset:
+    """Set of entry names in ``directory`` (empty if unreadable).
+
+    Symlinks are left out since their target may not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if not entry.is_symlink())
+    except OSError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation config key into its components (cached)."""
+    return tuple(key.split("."))
+
+
+# (directive, slurm config key, default, required) for every header directive,
+# in header order. Required directives are emitted unless their value is None,
+# falling back to the slurm defaults; optional ones only when set. gres is
+# derived from gres_gpu and omitted when it is 0.
+_SLURM_DIRECTIVES: Tuple[Tuple[str, str, Any, bool], ...] = tuple(
+    (directive, key, _STATIC_DEFAULTS["slurm"][key] if required else None, required)
+    for directive, key, required in (
+        ("job-name", "job_name", True),
+        ("nodes", "nodes", True),
+        ("ntasks", "ntasks", True),
+        ("cpus-per-task", "cpus_per_task", True),
+        ("gres", "gres_gpu", True),
+        ("time", "time", True),
+        ("partition", "partition", True),
+        ("qos", "qos", True),
+        ("account", "account", True),
+        ("mem", "mem", True),
+        ("output", "output", True),
+        ("error", "error", True),
+        ("mail-type", "mail_type", False),
+        ("mail-user", "mail_user", False),
+        ("exclude", "exclude", False),
+        ("dependency", "dependency", False),
+        ("array", "array", False),
+    )
+)
+
+# Upper bound on header length: shebang, every directive and the comment
+_SLURM_HEADER_MAX_LINES = len(_SLURM_DIRECTIVES) + 2
+
+
+@functools.lru_cache(maxsize=32)
+def _build_slurm_header(items: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """Render a SLURM header from the (key, type, value) triples of a slurm config.
+
+    Cached on the config contents, since the same header is typically
+    generated many times for a series of job submissions. Each value carries
+    its type so that equal values of different types (1, 1.0 and True), which
+    render differently, do not share a cache entry.
+    """
+    slurm_config = {key: value for key, _, value in items}
+    cfg_get = slurm_config.get
+
+    # Preallocated to the maximum length and trimmed at the end
+    header_lines: List[Optional[str]] = [None] * _SLURM_HEADER_MAX_LINES
+    header_lines[0] = "#!/bin/bash"
+    n = 1
+
+    for directive, key, default, required in _SLURM_DIRECTIVES:
+        if key == "gres_gpu":
+            gpus = cfg_get("gres_gpu", 0)
+            value = f"gpu:{gpus}" if gpus > 0 else None
+        else:
+            value = cfg_get(key, default)
+        if (value is not None) if required else value:
+            header_lines[n] = f"#SBATCH --{directive}={value}"
+            n += 1
+
+    # Add comment if provided
+    comment = cfg_get("comment", "")
+    if comment:
+        header_lines[n] = f"# {comment}"
+        n += 1
+
+    return "\n".join(header_lines[:n])
+
+
+# Parsed config.json contents shared across ConfigManager instances, keyed by
+# path and validated against the file's (st_mtime_ns, st_size)
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Parsed pyproject.toml metadata keyed by (path, st_mtime_ns)
+_METADATA_CACHE: Dict[Tuple[Path, int], Dict[str, Any]] = {}
+
+# Shared ConfigManager instances handed out by ConfigManager.shared()
+_INSTANCES: Dict[Path, "ConfigManager"] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def _cache_config(path: Path, config: Dict[str, Any]) -> Tuple[int, int]:
+    """Store a snapshot of ``config`` as the current contents of ``path``.
+
+    Returns the (st_mtime_ns, st_size) the snapshot was recorded against.
+    """
+    st = path.stat()
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+    return st.st_mtime_ns, st.st_size
+
+
+def _invalidate_config_cache(path: Path) -> None:
+    """Drop any cached contents for ``path``."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.pop(path, None)
 
 
 class ConfigManager:
@@ -18,6 +273,24 @@ class ConfigManager:
     and dependency paths.
     """
 
+    # Shared by all instances; handler configuration is left to the application
+    logger = _logger
+
+    # Fixed attribute set; config and project_metadata are lazy properties
+    # backed by _config and _project_metadata
+    __slots__ = (
+        "project_root",
+        "config_path",
+        "_project_metadata",
+        "_paths_defaults",
+        "_config",
+        "_in_batch",
+        "_dirty",
+        "_enabled_cache",
+        "_last_written",
+        "_save_lock",
+    )
+
     def __init__(self, config_path: Optional[Union[str, Path]] = None):
         """
         Initialize the configuration manager.
@@ -30,70 +303,124 @@ class ConfigManager:
             Path(config_path) if config_path else self.project_root / "config.json"
         )
 
-        # Setup logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
-
-        # Load project metadata from pyproject.toml
-        self.project_metadata = self._load_project_metadata()
-
-        # Default configuration structure
-        self.default_config = {
-            "project_info": {
-                "name": self.project_metadata["name"],
-                "version": self.project_metadata["version"],
-                "description": self.project_metadata["description"],
-            },
-            "paths": {
-                "project_root": str(self.project_root),
-                "src_dir": str(self.project_root / "src"),
-                "docs_dir": str(self.project_root / "docs"),
-                "output_dir": str(self.project_root / "output"),
-                "temp_dir": str(self.project_root / "temp"),
-            },
-            "dependencies": {
-                "topaz": {
-                    "path": "/uufs/chpc.utah.edu/sys/installdir/r8/topaz/0.3.7/bin/topaz",
-                    "version": "3.0.7",
-                    "enabled": True,
-                },
-                "model_angelo": {
-                    "path": "/uufs/chpc.utah.edu/sys/installdir/model-angelo/1.0.1/bin/model_angelo",
-                    "version": "1.0.1",
-                    "enabled": True,
-                },
-            },
-            "settings": {
-                "max_threads": 4,
-                "memory_limit_gb": 16,
-                "gpu_enabled": False,
-                "debug_mode": False,
-                "log_level": "INFO",
-            },
-            "slurm": {
-                "job_name": "cryodl_job",
-                "nodes": 1,
-                "ntasks": 1,
-                "cpus_per_task": 4,
-                "gres_gpu": 1,
-                "time": "06:00:00",
-                "partition": "notchpeak-gpu",
-                "qos": "notchpeak-gpu",
-                "account": "notchpeak-gpu",
-                "mem": "96G",
-                "output": "slurm-%j.out-%N",
-                "error": "slurm-%j.err-%N",
-                "mail_type": "",
-                "mail_user": "",
-                "exclude": "",
-                "dependency": "",
-                "array": "",
-                "comment": "SLURM job configuration for cryoDL workflows",
-            },
+        # pyproject.toml is only read when project metadata is first needed
+        self._project_metadata: Optional[Dict[str, Any]] = None
+
+        # Path defaults depend on the project root; the rest of the default
+        # configuration is only assembled when it is actually needed
+        self._paths_defaults = {
+            "project_root": str(self.project_root),
+            "src_dir": str(self.project_root / "src"),
+            "docs_dir": str(self.project_root / "docs"),
+            "output_dir": str(self.project_root / "output"),
+            "temp_dir": str(self.project_root / "temp"),
         }
 
-        # Load or create configuration
-        self.config = self.load_config()
+        # Nesting depth of batch_updates() and whether a save was deferred
+        self._in_batch = 0
+        self._dirty = False
+
+        # Configuration is loaded (or created) on first access to self.config
+        self._config: Optional[Dict[str, Any]] = None
+
+        # Memoized get_enabled_dependencies() result
+        self._enabled_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # (bytes, st_mtime_ns, st_size) of the last write to config_path
+        self._last_written: Optional[Tuple[bytes, int, int]] = None
+
+        # Serialises updates of the shared configuration with saves of it
+        self._save_lock = threading.RLock()
+
+    @classmethod
+    def shared(cls, config_path: Optional[Union[str, Path]] = None) -> "ConfigManager":
+        """Return the process-wide ConfigManager for a config file.
+
+        Instances are memoized by resolved config path, so modules that all
+        need the configuration share one manager instead of each re-reading
+        pyproject.toml and config.json.
+
+        Args:
+            config_path (Optional[Union[str, Path]]): Path to config.json file.
+                If None, uses default location.
+
+        Returns:
+            ConfigManager: The shared instance for that config file.
+
+        Example:
+            config_manager = ConfigManager.shared()
+            config_manager is ConfigManager.shared()
+            True
+        """
+        if config_path is None:
+            config_path = Path(__file__).parent.parent / "config.json"
+        key = Path(config_path).resolve()
+        with _INSTANCES_LOCK:
+            instance = _INSTANCES.get(key)
+            if instance is None:
+                instance = _INSTANCES[key] = cls(key)
+        return instance
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current configuration, loaded from config.json on first access.
+
+        Returns:
+            Dict[str, Any]: The active configuration dictionary.
+        """
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._enabled_cache = None
+
+    @property
+    def project_metadata(self) -> Dict[str, Any]:
+        """Project metadata from pyproject.toml, loaded on first access.
+
+        Returns:
+            Dict[str, Any]: Dictionary with name, version and description keys.
+        """
+        if self._project_metadata is None:
+            self._project_metadata = self._load_project_metadata()
+        return self._project_metadata
+
+    @property
+    def default_config(self) -> Dict[str, Any]:
+        """Default configuration structure.
+
+        A new tree is built on every access, so modifying the result never
+        affects later defaults.
+
+        Returns:
+            Dict[str, Any]: Default configuration with sections for project_info,
+                paths, dependencies, settings, and slurm.
+        """
+        return self._build_default_config()
+
+    def _build_default_config(self) -> Dict[str, Any]:
+        """Build a fresh, unaliased default configuration tree.
+
+        Returns:
+            Dict[str, Any]: Default configuration in canonical key order.
+        """
+        # The static sections already come back sorted; only the per-project
+        # sections and the top level need ordering here
+        config = {
+            "project_info": _sort_tree(
+                {
+                    "name": self.project_metadata["name"],
+                    "version": self.project_metadata["version"],
+                    "description": self.project_metadata["description"],
+                }
+            ),
+            "paths": _sort_tree(self._paths_defaults),
+            **_fresh_static_defaults(),
+        }
+        return {key: config[key] for key in sorted(config)}
 
     def _load_project_metadata(self) -> Dict[str, Any]:
         """Load project metadata from pyproject.toml file.
@@ -115,15 +442,27 @@ class ConfigManager:
         """
         pyproject_path = self.project_root / "pyproject.toml"
 
-        if not pyproject_path.exists():
-            self.logger.warning(f"pyproject.toml not found at {pyproject_path}")
+        try:
+            mtime_ns = pyproject_path.stat().st_mtime_ns
+        except OSError:
+            self.logger.warning("pyproject.toml not found at %s", pyproject_path)
             return {
                 "name": "cryoDL",
                 "version": "0.3.0",
                 "description": "Python Wrapper for Cryo-EM Deep Learning Software Packages",
             }
 
+        cached = _METADATA_CACHE.get((pyproject_path, mtime_ns))
+        if cached is not None:
+            return dict(cached)
+
         try:
+            # Only needed here, so the TOML parser is not imported at startup
+            try:
+                import tomllib
+            except ImportError:
+                import tomli as tomllib
+
             with open(pyproject_path, "rb") as f:
                 pyproject_data = tomllib.load(f)
 
@@ -137,11 +476,14 @@ class ConfigManager:
                 ),
             }
 
-            self.logger.info(f"Loaded project metadata from pyproject.toml: {metadata}")
-            return metadata
+            self.logger.info(
+                "Loaded project metadata from pyproject.toml: %s", metadata
+            )
+            _METADATA_CACHE[(pyproject_path, mtime_ns)] = metadata
+            return dict(metadata)
 
         except Exception as e:
-            self.logger.error(f"Error reading pyproject.toml: {e}")
+            self.logger.error("Error reading pyproject.toml: %s", e)
             return {
                 "name": "cryoDL",
                 "version": "0.3.0",
@@ -182,19 +524,33 @@ class ConfigManager:
             print(config['project_info']['version'])
             '0.3.0'
         """
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "r") as f:
-                    config = json.load(f)
-                self.logger.info(f"Configuration loaded from {self.config_path}")
-                return config
-            except (json.JSONDecodeError, IOError) as e:
-                self.logger.warning(f"Error loading config: {e}. Creating new config.")
-                return self.create_default_config()
-        else:
+        # A single stat both checks for the file and validates the cache
+        try:
+            st = self.config_path.stat()
+        except OSError:
             self.logger.info("Config file not found. Creating default configuration.")
             return self.create_default_config()
 
+        try:
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(self.config_path)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                self.logger.info("Configuration loaded from %s", self.config_path)
+                return copy.deepcopy(cached[2])
+
+            config = _sort_tree(_loads(self.config_path.read_bytes()))
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[self.config_path] = (
+                    st.st_mtime_ns,
+                    st.st_size,
+                    copy.deepcopy(config),
+                )
+            self.logger.info("Configuration loaded from %s", self.config_path)
+            return config
+        except (json.JSONDecodeError, IOError) as e:
+            self.logger.warning("Error loading config: %s. Creating new config.", e)
+            return self.create_default_config()
+
     def create_default_config(self) -> Dict[str, Any]:
         """Create and save default configuration.
 
@@ -210,18 +566,25 @@ class ConfigManager:
             print(config['settings']['max_threads'])
             4
         """
-        # Create necessary directories
-        for path_key, path_value in self.default_config["paths"].items():
-            if (
-                path_key != "project_root"
-                and path_key != "src_dir"
-                and path_key != "docs_dir"
-            ):
-                Path(path_value).mkdir(exist_ok=True)
-
-        # Save default config
-        self.save_config(self.default_config)
-        return self.default_config
+        default_config = self._build_default_config()
+
+        # Create the working directories that are missing
+        for path_key in _CREATED_PATH_KEYS:
+            path_value = default_config["paths"][path_key]
+            if not os.path.isdir(path_value):
+                os.makedirs(path_value, exist_ok=True)
+
+        # Save default config, reusing the serialised form if this process
+        # has already produced the same defaults
+        key = (
+            tuple(default_config["paths"].items()),
+            tuple(default_config["project_info"].items()),
+        )
+        data = _DEFAULT_CONFIG_BYTES.get(key)
+        if data is None:
+            data = _DEFAULT_CONFIG_BYTES[key] = _dumps(default_config)
+        self._write_config_bytes(data, default_config)
+        return default_config
 
     def save_config(self, config: Optional[Dict[str, Any]] = None) -> None:
         """Save configuration to file.
@@ -243,16 +606,75 @@ class ConfigManager:
             custom_config = {'settings': {'max_threads': 8}}
             config_manager.save_config(custom_config)
         """
-        if config is None:
-            config = self.config
+        with self._save_lock:
+            if config is None:
+                if self._in_batch:
+                    self._dirty = True
+                    return
+                if self._config is None:
+                    # Nothing has been loaded or modified, so there is nothing to save
+                    return
+                config = self._config
+
+            self._write_config_bytes(_dumps(config), config)
 
+    def _write_config_bytes(self, data: bytes, config: Dict[str, Any]) -> None:
+        """Write already serialised ``config`` to the config file.
+
+        Args:
+            data (bytes): Serialised form of ``config``.
+            config (Dict[str, Any]): The configuration ``data`` was produced from.
+
+        Raises:
+            IOError: If the file cannot be written to.
+        """
+        with self._save_lock:
+            # Skip the write if these exact bytes are what we last wrote and the
+            # file has not been touched since
+            if self._last_written is not None and self._last_written[0] == data:
+                try:
+                    st = self.config_path.stat()
+                except OSError:
+                    pass
+                else:
+                    if (st.st_mtime_ns, st.st_size) == self._last_written[1:]:
+                        self.logger.debug("Configuration unchanged, not rewriting")
+                        return
+
+            try:
+                _atomic_write_bytes(self.config_path, data)
+                self._last_written = (data, *_cache_config(self.config_path, config))
+                self.logger.info("Configuration saved to %s", self.config_path)
+            except IOError as e:
+                self.logger.error("Error saving config: %s", e)
+                raise
+
+    @contextlib.contextmanager
+    def batch_updates(self) -> Iterator["ConfigManager"]:
+        """Group several updates into a single configuration write.
+
+        While the context is active, calls that would save the current
+        configuration only mark it as modified; one save is performed when the
+        outermost context exits. Contexts may be nested.
+
+        Yields:
+            ConfigManager: This configuration manager.
+
+        Example:
+            with config_manager.batch_updates():
+                config_manager.update_dependency_path('topaz', '/usr/local/bin/topaz')
+                config_manager.update_slurm_config(nodes=2, gres_gpu=2)
+            # config.json is written once here
+        """
+        self._in_batch += 1
         try:
-            with open(self.config_path, "w") as f:
-                json.dump(config, f, indent=4, sort_keys=True)
-            self.logger.info(f"Configuration saved to {self.config_path}")
-        except IOError as e:
-            self.logger.error(f"Error saving config: {e}")
-            raise
+            yield self
+        finally:
+            self._in_batch -= 1
+            if not self._in_batch and self._dirty:
+                self.save_config()
+                # Only a successful write settles the deferred save
+                self._dirty = False
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
@@ -273,7 +695,7 @@ class ConfigManager:
             config_manager.get('nonexistent.key', 'default')
             'default'
         """
-        keys = key.split(".")
+        keys = _split_key(key)
         value = self.config
 
         try:
@@ -297,18 +719,22 @@ class ConfigManager:
             config_manager.set('settings.max_threads', 8)
             config_manager.set('new_section.new_key', 'new_value')
         """
-        keys = key.split(".")
-        config = self.config
+        keys = _split_key(key)
+
+        with self._save_lock:
+            config = self.config
 
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+            # Navigate to the parent of the target key
+            for k in keys[:-1]:
+                if k not in config:
+                    _set_sorted(config, k, {})
+                config = config[k]
 
-        # Set the value
-        config[keys[-1]] = value
-        self.logger.info(f"Set config key '{key}' to '{value}'")
+            # Set the value, keeping the parent in canonical key order
+            _set_sorted(config, keys[-1], _sort_tree(value))
+            if keys[0] == "dependencies":
+                self._enabled_cache = None
+        self.logger.info("Set config key '%s' to '%s'", key, value)
 
     def update_dependency_path(
         self, dependency: str, path: str, version: str = ""
@@ -329,15 +755,16 @@ class ConfigManager:
             config_manager.update_dependency_path('model_angelo', '/path/to/model_angelo')
         """
         if dependency not in self.config["dependencies"]:
-            self.logger.warning(f"Unknown dependency: {dependency}")
+            self.logger.warning("Unknown dependency: %s", dependency)
             return
 
-        self.config["dependencies"][dependency]["path"] = path
-        self.config["dependencies"][dependency]["version"] = version
-        self.config["dependencies"][dependency]["enabled"] = bool(path)
-
-        self.save_config()
-        self.logger.info(f"Updated {dependency} path: {path}")
+        with self._save_lock:
+            self.config["dependencies"][dependency]["path"] = path
+            self.config["dependencies"][dependency]["version"] = version
+            self.config["dependencies"][dependency]["enabled"] = bool(path)
+            self._enabled_cache = None
+            self.save_config()
+        self.logger.info("Updated %s path: %s", dependency, path)
 
     def validate_dependency_path(self, dependency: str) -> bool:
         """Validate if a dependency path exists and is accessible.
@@ -366,11 +793,52 @@ class ConfigManager:
 
         return Path(path).exists()
 
+    def validate_all_dependency_paths(self) -> Dict[str, bool]:
+        """Validate the paths of all configured dependencies at once.
+
+        Dependencies are grouped by parent directory. A directory holding
+        several of them is listed once with os.scandir, so dependencies
+        installed side by side cost a single directory read rather than one
+        stat call each. Paths that the listing cannot confirm (lone paths,
+        symlinks, unreadable directories, names such as "..") are checked with
+        the same exists() lookup, so the result always agrees with
+        validate_dependency_path(). Nothing is cached, so a dependency
+        installed since the last call is picked up straight away.
+
+        Returns:
+            Dict[str, bool]: Mapping of dependency name to whether its path exists.
+
+        Example:
+            config_manager.validate_all_dependency_paths()
+            {'topaz': True, 'model_angelo': False}
+        """
+        deps = self.config["dependencies"]
+
+        by_parent: Dict[Path, List[str]] = {}
+        for info in deps.values():
+            path = info.get("path")
+            if path:
+                by_parent.setdefault(Path(path).parent, []).append(path)
+
+        existing = set()
+        for parent, paths in by_parent.items():
+            names = _list_dir(parent) if len(set(paths)) > 1 else frozenset()
+            existing.update(
+                p for p in paths if Path(p).name in names or Path(p).exists()
+            )
+
+        return {
+            name: bool(info.get("path")) and info["path"] in existing
+            for name, info in deps.items()
+        }
+
     def list_dependencies(self) -> Dict[str, Dict[str, Any]]:
         """Get all configured dependencies.
 
         Returns a dictionary containing all dependencies configured in the system,
-        including their paths, versions, and enabled status.
+        including their paths, versions, and enabled status. It is a copy, so
+        changes to it do not reach the configuration; use set or
+        update_dependency_path instead.
 
         Returns:
             Dict[str, Dict[str, Any]]: Dictionary where keys are dependency names and
@@ -384,13 +852,15 @@ class ConfigManager:
             print(deps['topaz']['path'])
             '/usr/local/bin/topaz'
         """
-        return self.config["dependencies"]
+        return copy.deepcopy(self.config["dependencies"])
 
     def get_enabled_dependencies(self) -> Dict[str, Dict[str, Any]]:
         """Get only enabled dependencies.
 
         Returns a filtered dictionary containing only the dependencies that are
-        currently enabled in the configuration.
+        currently enabled in the configuration. The result is cached until the
+        dependencies are changed through set, update_dependency_path,
+        reset_config or import_config, so callers should not modify it.
 
         Returns:
             Dict[str, Dict[str, Any]]: Dictionary containing only enabled dependencies
@@ -401,11 +871,28 @@ class ConfigManager:
             print(list(enabled_deps.keys()))
             ['topaz', 'model_angelo']
         """
-        return {
-            name: info
-            for name, info in self.config["dependencies"].items()
-            if info.get("enabled", False)
-        }
+        if self._enabled_cache is None:
+            self._enabled_cache = {
+                name: info
+                for name, info in self.config["dependencies"].items()
+                if info.get("enabled", False)
+            }
+        return self._enabled_cache
+
+    def iter_enabled_dependencies(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over enabled dependencies without building a dictionary.
+
+        Yields:
+            Tuple[str, Dict[str, Any]]: (name, configuration) pairs for each
+                enabled dependency, in configuration order.
+
+        Example:
+            for name, info in config_manager.iter_enabled_dependencies():
+                print(name, info['path'])
+        """
+        for name, info in self.config["dependencies"].items():
+            if info.get("enabled", False):
+                yield name, info
 
     def reset_config(self) -> None:
         """Reset configuration to default values.
@@ -418,7 +905,8 @@ class ConfigManager:
             config_manager.reset_config()
             # Configuration is now reset to defaults
         """
-        self.config = self.default_config.copy()
+        _invalidate_config_cache(self.config_path)
+        self.config = self._build_default_config()
         self.save_config()
         self.logger.info("Configuration reset to defaults")
 
@@ -441,11 +929,10 @@ class ConfigManager:
         """
         export_path = Path(export_path)
         try:
-            with open(export_path, "w") as f:
-                json.dump(self.config, f, indent=4, sort_keys=True)
-            self.logger.info(f"Configuration exported to {export_path}")
+            _atomic_write_bytes(export_path, _dumps(self.config))
+            self.logger.info("Configuration exported to %s", export_path)
         except IOError as e:
-            self.logger.error(f"Error exporting config: {e}")
+            self.logger.error("Error exporting config: %s", e)
             raise
 
     def import_config(self, import_path: Union[str, Path]) -> None:
@@ -468,13 +955,13 @@ class ConfigManager:
         """
         import_path = Path(import_path)
         try:
-            with open(import_path, "r") as f:
-                new_config = json.load(f)
+            new_config = _sort_tree(_loads(import_path.read_bytes()))
             self.config = new_config
+            _invalidate_config_cache(self.config_path)
             self.save_config()
-            self.logger.info(f"Configuration imported from {import_path}")
+            self.logger.info("Configuration imported from %s", import_path)
         except (json.JSONDecodeError, IOError) as e:
-            self.logger.error(f"Error importing config: {e}")
+            self.logger.error("Error importing config: %s", e)
             raise
 
     def generate_slurm_header(self, job_name: Optional[str] = None, **kwargs) -> str:
@@ -521,57 +1008,12 @@ class ConfigManager:
             if key in slurm_config:
                 slurm_config[key] = value
 
-        # Build SLURM header
-        header_lines = ["#!/bin/bash"]
-
-        # Add SLURM directives
-        directives = [
-            ("job-name", slurm_config.get("job_name", "cryodl_job")),
-            ("nodes", slurm_config.get("nodes", 1)),
-            ("ntasks", slurm_config.get("ntasks", 1)),
-            ("cpus-per-task", slurm_config.get("cpus_per_task", 4)),
-            (
-                "gres",
-                (
-                    f"gpu:{slurm_config.get('gres_gpu', 1)}"
-                    if slurm_config.get("gres_gpu", 0) > 0
-                    else None
-                ),
-            ),
-            ("time", slurm_config.get("time", "06:00:00")),
-            ("partition", slurm_config.get("partition", "notchpeak-gpu")),
-            ("qos", slurm_config.get("qos", "notchpeak-gpu")),
-            ("account", slurm_config.get("account", "notchpeak-gpu")),
-            ("mem", slurm_config.get("mem", "96G")),
-            ("output", slurm_config.get("output", "slurm-%j.out-%N")),
-            ("error", slurm_config.get("error", "slurm-%j.err-%N")),
-        ]
-
-        # Add optional directives
-        optional_directives = [
-            ("mail-type", slurm_config.get("mail_type")),
-            ("mail-user", slurm_config.get("mail_user")),
-            ("exclude", slurm_config.get("exclude")),
-            ("dependency", slurm_config.get("dependency")),
-            ("array", slurm_config.get("array")),
-        ]
-
-        # Add required directives
-        for directive, value in directives:
-            if value is not None:
-                header_lines.append(f"#SBATCH --{directive}={value}")
-
-        # Add optional directives (only if they have values)
-        for directive, value in optional_directives:
-            if value:
-                header_lines.append(f"#SBATCH --{directive}={value}")
-
-        # Add comment if provided
-        comment = slurm_config.get("comment", "")
-        if comment:
-            header_lines.append(f"# {comment}")
-
-        return "\n".join(header_lines)
+        items = tuple((key, type(value), value) for key, value in slurm_config.items())
+        try:
+            return _build_slurm_header(items)
+        except TypeError:
+            # Unhashable values (e.g. lists from a hand-edited config) bypass the cache
+            return _build_slurm_header.__wrapped__(items)
 
     def update_slurm_config(self, **kwargs) -> None:
         """Update SLURM configuration parameters.
@@ -604,14 +1046,15 @@ class ConfigManager:
             config_manager.update_slurm_config(nodes=2, gres_gpu=2, time='12:00:00')
             config_manager.update_slurm_config(partition='gpu', account='my_account')
         """
-        if "slurm" not in self.config:
-            self.config["slurm"] = {}
-
-        for key, value in kwargs.items():
-            self.config["slurm"][key] = value
+        with self._save_lock:
+            if "slurm" not in self.config:
+                _set_sorted(self.config, "slurm", {})
 
-        self.save_config()
-        self.logger.info(f"Updated SLURM configuration: {list(kwargs.keys())}")
+            for key, value in kwargs.items():
+                _set_sorted(self.config["slurm"], key, value)
+            self.save_config()
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Updated SLURM configuration: %s", list(kwargs))
 
     def get_slurm_config(self) -> Dict[str, Any]:
         """Get current SLURM configuration.
@@ -659,11 +1102,10 @@ class ConfigManager:
         header_content = self.generate_slurm_header(job_name, **kwargs)
 
         try:
-            with open(output_path, "w") as f:
-                f.write(header_content)
-            self.logger.info(f"SLURM header saved to {output_path}")
+            _atomic_write_bytes(output_path, header_content.encode("utf-8"))
+            self.logger.info("SLURM header saved to %s", output_path)
         except IOError as e:
-            self.logger.error(f"Error saving SLURM header: {e}")
+            self.logger.error("Error saving SLURM header: %s", e)
             raise
 
 
@@ -681,18 +1123,20 @@ def main():
             topaz path valid: True
             model_angelo path valid: False
     """
+    logging.basicConfig(level=logging.INFO)
+
     # Initialize config manager
-    config_manager = ConfigManager()
+    config_manager = ConfigManager.shared()
 
-    # Example: Set some configuration values
-    config_manager.set("settings.max_threads", 8)
-    config_manager.set("settings.gpu_enabled", True)
+    # Example: Set configuration values and dependency paths with one write
+    with config_manager.batch_updates():
+        config_manager.set("settings.max_threads", 8)
+        config_manager.set("settings.gpu_enabled", True)
 
-    # Example: Update dependency paths
-    config_manager.update_dependency_path("topaz", "/path/to/topaz", "0.2.5")
-    config_manager.update_dependency_path(
-        "model_angelo", "/path/to/model_angelo", "1.0.0"
-    )
+        config_manager.update_dependency_path("topaz", "/path/to/topaz", "0.2.5")
+        config_manager.update_dependency_path(
+            "model_angelo", "/path/to/model_angelo", "1.0.0"
+        )
 
     # Example: Get configuration values
     print(f"Project root: {config_manager.get('paths.project_root')}")
@@ -702,8 +1146,7 @@ def main():
     )
 
     # Example: Validate dependency paths
-    for dep_name in config_manager.config["dependencies"]:
-        is_valid = config_manager.validate_dependency_path(dep_name)
+    for dep_name, is_valid in config_manager.validate_all_dependency_paths().items():
         print(f"{dep_name} path valid: {is_valid}")
 
 
@@ -6,26 +6,471 @@ This module contains analysis functions for Topaz results, including
 cross-validation analysis and performance evaluation.
 """
 
+import os
+import sys
+
 import numpy as np
 import pandas as pd
 import matplotlib
+
+# Headless Linux nodes (e.g. cluster jobs) have no display to draw on; pick Agg
+# up front so importing pyplot does not probe for GUI toolkits. A backend the
+# caller already chose (MPLBACKEND, matplotlibrc, matplotlib.use) is kept.
+if (
+        sys.platform.startswith("linux")
+        and dict.__getitem__(matplotlib.rcParams, "backend")
+        is matplotlib.rcsetup._auto_backend_sentinel
+        and not os.environ.get("DISPLAY")
+        and not os.environ.get("WAYLAND_DISPLAY")
+):
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-from PIL import Image
-import glob
-import os
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+import functools
+import hashlib
+import importlib.util
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-import logging
 
-# Try to import topaz utilities, but don't fail if not available
-try:
-    from topaz.utils.data.loader import load_image
+# Optional accelerators. They are only imported by the helpers that use them,
+# so importing this module (e.g. for the denoising workflow) stays cheap.
+# pyarrow's multithreaded CSV reader is used for training logs when available
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# numba JIT-compiles the frame summation and micrograph statistics kernels
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# duckdb reads and filters all training logs in a single parallel query
+DUCKDB_AVAILABLE = importlib.util.find_spec("duckdb") is not None
+
+
+# Compact dtypes for the cross-validation table: N and fold have few distinct
+# values and split is a handful of repeated labels
+_CV_RESULT_DTYPES = {
+    "epoch": "int32",
+    "auprc": "float64",
+    "split": "category",
+    "N": "int16",
+    "fold": "int8",
+}
+
+# Columns Topaz only reports for the training split
+_TRAIN_ONLY_COLUMNS = ("iter", "ge_penalty")
+
+# Text sizes and grid shared by the cross-validation panels
+_CV_STYLE = {
+    "axes.labelsize": 12,
+    "axes.titlesize": 14,
+    "legend.fontsize": 10,
+    "axes.grid": True,
+    "grid.alpha": 0.3,
+}
+
+
+def _arrow_dtype(arrow_type):
+    """
+    Map Arrow types to pandas dtypes when converting a cross-validation table.
+
+    Dictionary-encoded columns become pandas categoricals; everything else is
+    kept Arrow-backed.
+    """
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def _best_per_row(grid: np.ndarray) -> np.ndarray:
+    """
+    Column index of the largest value in each row of a 2D grid.
+
+    NaNs are ignored and ties go to the first column. Uses a numba kernel
+    when numba is installed.
+
+    Args:
+        grid: 2D float64 array, e.g. mean AUPRC with one row per N
+
+    Returns:
+        int64 array with one column index per row, or -1 for rows that are
+        entirely NaN
+    """
+    if NUMBA_AVAILABLE:
+        return _argmax_rows(np.ascontiguousarray(grid))
+    missing = np.isnan(grid)
+    best = np.argmax(np.where(missing, -np.inf, grid), axis=1)
+    best[missing.all(axis=1)] = -1
+    return best
+
+
+def _json_scalar(value):
+    """
+    Convert NumPy scalars to plain Python values for json.dump.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _groupby_mean(data: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """
+    Mean of every numeric column of data for each group of keys.
+
+    The keys are mapped onto a dense grid of cells and each column is summed
+    into it with np.add.at, which for the small N x epoch grid of a
+    cross-validation run avoids pandas' groupby machinery entirely. Missing
+    values are skipped, as in DataFrame.mean().
+
+    Args:
+        data: DataFrame to aggregate
+        keys: Columns to group by
+
+    Returns:
+        DataFrame with one row per group, sorted by the group keys, and the
+        group keys as columns
+    """
+    numeric = data.select_dtypes("number")
+    columns = [column for column in numeric.columns if column not in keys]
+
+    # Index every row by its cell in the grid of unique key combinations
+    uniques, codes = zip(
+        *(np.unique(numeric[key].to_numpy(), return_inverse=True) for key in keys)
+    )
+    shape = tuple(len(unique) for unique in uniques)
+    cells = np.ravel_multi_index([code.ravel() for code in codes], shape)
+
+    values = numeric[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    sums = np.zeros((int(np.prod(shape)), len(columns)))
+    counts = np.zeros_like(sums)
+    np.add.at(sums, cells, np.where(present, values, 0.0))
+    np.add.at(counts, cells, present)
+
+    # Only report cells that actually contain rows
+    occupied = np.flatnonzero(np.bincount(cells, minlength=len(sums)))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums[occupied] / counts[occupied]
+
+    result = {
+        key: unique[index]
+        for key, unique, index in zip(keys, uniques, np.unravel_index(occupied, shape))
+    }
+    result.update(zip(columns, means.T))
+    return pd.DataFrame(result)
+
+
+def _lazy_njit(**options):
+    """
+    Compile the decorated kernel with numba on its first call.
+
+    numba is only imported once a kernel actually runs; the machine code is
+    cached on disk, so later processes load rather than recompile it.
+
+    Args:
+        **options: Extra keyword arguments for numba.njit
+
+    Returns:
+        Decorator wrapping a kernel in a compile-on-first-call function
+    """
+
+    def decorate(kernel):
+        @functools.lru_cache(maxsize=None)
+        def compiled():
+            import numba
+
+            return numba.njit(cache=True, **options)(kernel)
+
+        @functools.wraps(kernel)
+        def call(*args):
+            return compiled()(*args)
+
+        return call
+
+    return decorate
+
+
+# Serial on purpose: it runs inside the movie-splitting worker processes,
+# which already use every core, so threads here would oversubscribe them
+@_lazy_njit()
+def _accumulate_alternate_frames(frames, odd_mic, even_mic):
+    # Walk the frames of each row once, adding into whichever sum the
+    # frame feeds
+    for y in range(frames.shape[1]):
+        for i in range(frames.shape[0]):
+            target = odd_mic if i % 2 == 0 else even_mic
+            for x in range(frames.shape[2]):
+                target[y, x] += frames[i, y, x]
+
+
+# No fastmath here: it would let LLVM assume there are no NaNs to skip
+@_lazy_njit()
+def _argmax_rows(grid):
+    # Column of the first maximum in each row, ignoring NaNs; -1 when a
+    # row has no values at all
+    best = np.full(grid.shape[0], -1, dtype=np.int64)
+    for i in range(grid.shape[0]):
+        peak = -np.inf
+        for j in range(grid.shape[1]):
+            if grid[i, j] > peak:
+                peak = grid[i, j]
+                best[i] = j
+    return best
+
+
+@_lazy_njit(fastmath=True)
+def _accumulate_moments(flat):
+    # Sum and sum of squares in one pass, accumulated in float64
+    total = 0.0
+    total_sq = 0.0
+    for i in range(flat.size):
+        value = np.float64(flat[i])
+        total += value
+        total_sq += value * value
+    return total, total_sq
+
+
+def _sum_alternate_frames(frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sum the odd and even frames of a movie stack in a single pass.
+
+    Each frame is read once and added into one of two preallocated float32
+    accumulators, so a memory-mapped stack is streamed from disk only once.
+
+    Args:
+        frames: Movie stack with shape (n_frames, height, width)
+
+    Returns:
+        Tuple of (odd_mic, even_mic): the sums of frames 1, 3, 5, ... and
+        2, 4, 6, ... (counting from one)
+    """
+    odd_mic = np.zeros(frames.shape[1:], dtype=np.float32)
+    even_mic = np.zeros_like(odd_mic)
+
+    # numba only handles native byte order; MRC files may be big-endian
+    if NUMBA_AVAILABLE and frames.dtype.isnative:
+        _accumulate_alternate_frames(np.asarray(frames), odd_mic, even_mic)
+    else:
+        for i in range(frames.shape[0]):
+            target = odd_mic if i % 2 == 0 else even_mic
+            np.add(target, frames[i], out=target, casting="unsafe")
+    return odd_mic, even_mic
+
+
+def _split_one_movie(
+        movie_path: Path, part_a_dir: Path, part_b_dir: Path
+) -> Tuple[str, Optional[Tuple[int, ...]], bool, Optional[str]]:
+    """
+    Split one movie into odd/even frame sums and save them as training data.
+
+    Runs in a worker process, so problems are reported back to the caller
+    instead of being printed here.
+
+    Args:
+        movie_path: Path to the movie stack (.mrc)
+        part_a_dir: Directory for the odd frame sums
+        part_b_dir: Directory for the even frame sums
+
+    Returns:
+        Tuple of (name, shape, split, error). split is False when the file is
+        not a 3D movie stack, and error is None unless processing failed.
+    """
+    import mrcfile
+
+    name = movie_path.name
+    shape = None
+
+    try:
+        # Memory-map the movie so frames are streamed rather than loaded
+        with mrcfile.mmap(movie_path, mode='r', permissive=True) as mrc:
+            frames = mrc.data
+            shape = frames.shape
+
+            # Split and sum frames
+            if len(frames.shape) != 3:
+                return name, shape, False, None
+            odd_mic, even_mic = _sum_alternate_frames(frames)
+
+        # Save the split micrographs
+        odd_path = part_a_dir / name
+        with mrcfile.new(odd_path, overwrite=True) as mrc:
+            mrc.set_data(odd_mic[np.newaxis, ...])
+
+        even_path = part_b_dir / name
+        with mrcfile.new(even_path, overwrite=True) as mrc:
+            mrc.set_data(even_mic[np.newaxis, ...])
+
+    except Exception as e:
+        return name, shape, False, str(e)
+
+    return name, shape, True, None
+
+
+def _read_cache_key(key_path: Path) -> Optional[str]:
+    """
+    Key of the cached cross-validation table, or None if there is no cache.
+    """
+    try:
+        return key_path.read_text()
+    except OSError:
+        return None
+
+
+def _read_cv_log(n: int, fold: int, path: Path):
+    """
+    Read one Topaz training log for the cross-validation analysis.
+
+    Uses pyarrow's CSV reader when available, returning an Arrow table with
+    only the validation rows; otherwise returns the whole log as a pandas
+    DataFrame, to be filtered once all logs are combined.
+
+    Args:
+        n: N value the model was trained with
+        fold: Cross-validation fold of the model
+        path: Path to the tab-separated training log
+
+    Returns:
+        Table of the log with N and fold columns appended
+    """
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(
+            path,
+            sep="\t",
+            usecols=lambda column: column not in _TRAIN_ONLY_COLUMNS,
+            dtype={"epoch": "int32", "auprc": "float64"},
+            na_values=["-"],
+        ).assign(N=np.int16(n), fold=np.int8(fold))
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        parse_options=pacsv.ParseOptions(delimiter="\t"),
+        # Topaz writes "-" for metrics that are not computed on a split
+        convert_options=pacsv.ConvertOptions(
+            column_types={
+                "epoch": pa.int32(),
+                "auprc": pa.float64(),
+                "split": pa.dictionary(pa.int32(), pa.string()),
+            },
+            null_values=["-"],
+        ),
+    )
+    # Only keep the validation results
+    table = table.filter(pc.equal(table["split"].cast(pa.string()), "test"))
+    return table.append_column(
+        "N", pa.array(np.full(table.num_rows, n, dtype=np.int16))
+    ).append_column("fold", pa.array(np.full(table.num_rows, fold, dtype=np.int8)))
+
+
+# Validation rows of every training log, with N and fold taken from the
+# file names written by the cross-validation runs
+_CV_LOGS_QUERY = r"""
+SELECT
+    * EXCLUDE (filename),
+    regexp_extract(filename, 'model_n(\d+)_fold(\d+)_training\.txt$', 1)::SMALLINT
+        AS N,
+    regexp_extract(filename, 'model_n(\d+)_fold(\d+)_training\.txt$', 2)::TINYINT
+        AS fold
+FROM read_csv(
+    $paths,
+    delim = '\t',
+    header = true,
+    nullstr = '-',
+    union_by_name = true,
+    filename = true,
+    types = {'epoch': 'INTEGER', 'auprc': 'DOUBLE', 'split': 'VARCHAR'}
+)
+WHERE split = 'test'
+"""
+
+
+def _read_cv_logs_duckdb(paths: List[Path]):
+    """
+    Read the validation rows of several Topaz training logs in one query.
+
+    Args:
+        paths: Paths to the tab-separated training logs
+
+    Returns:
+        Arrow table laid out like the concatenated output of ``_read_cv_log``
+    """
+    import duckdb
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    with duckdb.connect() as con:
+        table = con.execute(
+            _CV_LOGS_QUERY, {"paths": [str(path) for path in paths]}
+        ).fetch_arrow_table()
+    split = table.schema.get_field_index("split")
+    return table.set_column(
+        split, "split", pc.dictionary_encode(table["split"]).cast(
+            pa.dictionary(pa.int32(), pa.string())
+        )
+    )
+
+
+def _stack_validation_rows(tables: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Stack the validation rows of several training logs into one DataFrame.
+
+    Each column is allocated once at its final length and filled log by log,
+    instead of concatenating the logs and filtering the result.
+
+    Args:
+        tables: Training logs as returned by ``_read_cv_log``
+
+    Returns:
+        DataFrame with the validation rows of all logs, in order
+    """
+    columns = tables[0].columns
+    if any(not table.columns.equals(columns) for table in tables[1:]):
+        # Logs written by different Topaz versions; let pandas align them
+        combined = pd.concat(tables, axis=0, ignore_index=True)
+        return combined.loc[combined["split"].to_numpy() == "test"].reset_index(
+            drop=True
+        )
+
+    masks = [table["split"].to_numpy() == "test" for table in tables]
+    total = sum(int(mask.sum()) for mask in masks)
+    stacked = {}
+    for column in columns:
+        parts = [table[column].to_numpy() for table in tables]
+        out = np.empty(total, dtype=np.result_type(*parts))
+        start = 0
+        for values, mask in zip(parts, masks):
+            values = values[mask]
+            out[start : start + len(values)] = values
+            start += len(values)
+        stacked[column] = out
+    return pd.DataFrame(stacked, copy=False)
+
+
+def _new_figure(show_plots: bool, **kwargs) -> Figure:
+    """
+    Create a figure for the analysis plots.
+
+    Figures that are only saved are created outside pyplot, so they render
+    off-screen without switching the caller's backend and need no closing.
+
+    Args:
+        show_plots: Whether the figure will be displayed with plt.show()
+        **kwargs: Keyword arguments for the figure
 
-    TOPAZ_AVAILABLE = True
-except ImportError:
-    TOPAZ_AVAILABLE = False
-    logging.warning("Topaz utilities not available. Some functions may not work.")
+    Returns:
+        New figure, registered with pyplot only when it is to be shown
+    """
+    if show_plots:
+        return plt.figure(**kwargs)
+    return Figure(**kwargs)
 
 
 def analyze_cross_validation(
@@ -35,6 +480,9 @@ def analyze_cross_validation(
         output_dir: Optional[str] = None,
         save_plots: bool = True,
         show_plots: bool = False,
+        return_raw: bool = False,
+        save_png: bool = True,
+        save_pdf: bool = False,
 ) -> Dict:
     """
     Analyze cross-validation results from Topaz training.
@@ -49,10 +497,17 @@ def analyze_cross_validation(
         output_dir: Directory to save analysis results (defaults to cv_dir)
         save_plots: Whether to save generated plots
         show_plots: Whether to display plots interactively
+        return_raw: Whether to include the full per-fold results in the returned
+            dictionary (they are released as soon as the means are computed
+            otherwise)
+        save_png: Whether saved plots include the individual PNG images
+        save_pdf: Whether saved plots include a single multi-page
+            cv_analysis.pdf with one page per plot
 
     Returns:
         Dictionary containing analysis results including:
-        - cv_results: Full cross-validation results DataFrame
+        - cv_results: Full cross-validation results DataFrame (only when
+          return_raw is True)
         - cv_results_mean: Mean results across folds
         - cv_results_epoch: Best epoch results for each N
         - best_n: Recommended N value
@@ -72,45 +527,121 @@ def analyze_cross_validation(
     print(f"Analyzing cross-validation results from: {cv_dir}")
     print(f"Output directory: {output_dir}")
 
-    # Load cross-validation results
-    tables = []
+    # Locate the training logs for every (N, fold) combination from a single
+    # listing of the directory rather than probing each expected path
+    with os.scandir(cv_path) as it:
+        entries = {entry.name: entry for entry in it}
+    found = []
     for n in n_values:
         for fold in range(k_folds):
-            path = cv_path / f"model_n{n}_fold{fold}_training.txt"
-            if path.exists():
-                try:
-                    table = pd.read_csv(path, sep="\t")
-                    table["N"] = n
-                    table["fold"] = fold
-                    # Only keep the validation results
-                    table = table.loc[table["split"] == "test"]
-                    tables.append(table)
-                    print(f"Loaded results for N={n}, fold={fold}")
-                except Exception as e:
-                    print(f"Warning: Could not load {path}: {e}")
-            else:
-                print(f"Warning: File not found: {path}")
-
-    if not tables:
-        raise ValueError("No cross-validation results found!")
+            name = f"model_n{n}_fold{fold}_training.txt"
+            entry = entries.get(name)
+            if entry is None or not entry.is_file():
+                print(f"Warning: File not found: {cv_path / name}")
+                continue
+            found.append((n, fold, Path(entry.path), entry.stat()))
+
+    # Parsed results are cached as a single Feather file, keyed on the input
+    # files and their modification times, so re-running the analysis skips the
+    # TSV parsing. The key lives next to it and is replaced on every rebuild.
+    cache_path = output_path / ".cache" / "cv_results.feather"
+    key_path = cache_path.with_suffix(".key")
+    cache_key = None
+    if PYARROW_AVAILABLE:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    if PYARROW_AVAILABLE and found:
+        digest = hashlib.blake2b(digest_size=8)
+        # Tie the cache to the table layout as well as the inputs
+        digest.update(repr(sorted(_CV_RESULT_DTYPES.items())).encode())
+        for n, fold, path, stat in found:
+            digest.update(
+                f"{n}\0{fold}\0{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode()
+            )
+        cache_key = digest.hexdigest()
 
-    # Combine all results
-    cv_results = pd.concat(tables, axis=0, ignore_index=True)
-    cv_results["auprc"] = cv_results["auprc"].astype(float)
+    if cache_key is not None and _read_cache_key(key_path) == cache_key:
+        cv_results = feather.read_table(cache_path, memory_map=True).to_pandas(
+            types_mapper=_arrow_dtype
+        )
+        print(f"Loaded cached results: {cache_path}")
+    else:
+        tables = []
+        if DUCKDB_AVAILABLE and PYARROW_AVAILABLE and found:
+            import duckdb
+
+            try:
+                tables.append(_read_cv_logs_duckdb([path for _, _, path, _ in found]))
+                print(f"Loaded results for {len(found)} training logs")
+            except duckdb.Error as e:
+                print(f"Warning: Could not query training logs with duckdb: {e}")
+
+        if not tables:
+            # Load cross-validation results; the parsers release the GIL, so the
+            # logs are read concurrently and collected in their original order
+            with ThreadPoolExecutor(max_workers=min(32, len(found) or 1)) as executor:
+                futures = [
+                    (n, fold, path, executor.submit(_read_cv_log, n, fold, path))
+                    for n, fold, path, _ in found
+                ]
+                for n, fold, path, future in futures:
+                    try:
+                        tables.append(future.result())
+                        print(f"Loaded results for N={n}, fold={fold}")
+                    except Exception as e:
+                        print(f"Warning: Could not load {path}: {e}")
+
+        if not tables:
+            raise ValueError("No cross-validation results found!")
+
+        # Combine all results
+        if PYARROW_AVAILABLE:
+            cv_results = pa.concat_tables(tables)
+            # Drop columns that are only reported for the training split
+            cv_results = cv_results.drop_columns(
+                [
+                    name
+                    for name, column in zip(cv_results.column_names, cv_results.columns)
+                    if column.null_count == len(column)
+                ]
+            )
+            try:
+                cache_path.parent.mkdir(exist_ok=True)
+                # Invalidate first so a failed write never pairs with a stale key
+                key_path.unlink(missing_ok=True)
+                feather.write_feather(cv_results, cache_path, compression="zstd")
+                key_path.write_text(cache_key)
+            except OSError as e:
+                print(f"Warning: Could not write results cache {cache_path}: {e}")
+            cv_results = cv_results.to_pandas(types_mapper=_arrow_dtype)
+        else:
+            # Only keep the validation results
+            cv_results = _stack_validation_rows(tables)
+            cv_results = cv_results.astype(_CV_RESULT_DTYPES)
 
     print(f"Loaded {len(cv_results)} validation results")
     print(f"Results shape: {cv_results.shape}")
 
     # Calculate mean AUPRC for each condition and each epoch
-    cv_results_mean = (
-        cv_results.groupby(["N", "epoch"]).mean().reset_index().drop("fold", axis=1)
-    )
+    cv_results_mean = _groupby_mean(cv_results.drop(columns="fold"), ["N", "epoch"])
+    if not return_raw:
+        del cv_results
+
+    # Lay the mean AUPRC out as an epoch x N grid once; the best epochs, the
+    # per-N curves and the heatmap are all taken from it
+    heatmap_data = cv_results_mean.pivot(index="epoch", columns="N", values="auprc")
+    auprc_grid = heatmap_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    epochs = heatmap_data.index.to_numpy()
 
     # Find best epoch results for each N
+    best_rows = _best_per_row(auprc_grid.T)
+    found_n = best_rows >= 0
+    best_keys = pd.MultiIndex.from_arrays(
+        [heatmap_data.columns[found_n], epochs[best_rows[found_n]]],
+        names=["N", "epoch"],
+    )
     cv_results_epoch = (
-        cv_results_mean.groupby("N")
-        .apply(lambda x: x.loc[x["auprc"].idxmax()])
-        .reset_index(drop=True)
+        cv_results_mean.set_index(["N", "epoch"]).loc[best_keys].reset_index()
     )
 
     # Find overall best parameters
@@ -127,102 +658,102 @@ def analyze_cross_validation(
     # Generate plots
     plots = {}
 
-    # Plot 1: AUPRC vs Epoch for each N
-    plt.figure(figsize=(12, 8))
-    for n in n_values:
-        result = cv_results_mean[cv_results_mean["N"] == n]
-        if not result.empty:
-            plt.plot(
-                result["epoch"],
-                result["auprc"],
+    # Set text sizes and the grid once for every plot; the style has to stay
+    # active while saving, since tick labels are only created at draw time
+    with plt.style.context(_CV_STYLE):
+        # Plot 1: AUPRC vs Epoch for each N
+        perf_fig = _new_figure(show_plots, figsize=(12, 8), tight_layout=True)
+        ax = perf_fig.add_subplot()
+        for n, curve in zip(heatmap_data.columns, auprc_grid.T):
+            present = ~np.isnan(curve)
+            ax.plot(
+                epochs[present],
+                curve[present],
                 "-o",
                 label=f"N={n}",
                 linewidth=2,
                 markersize=6,
+                rasterized=True,
             )
 
-    plt.xlabel("Epoch", fontsize=12)
-    plt.ylabel("AUPRC", fontsize=12)
-    plt.title("Cross-validation Performance: AUPRC vs Epoch", fontsize=14)
-    plt.legend(loc="best", fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-
-    if save_plots:
-        plot_path = output_path / "cv_performance_vs_epoch.png"
-        plt.savefig(plot_path, dpi=300, bbox_inches="tight")
-        print(f"Saved performance plot: {plot_path}")
-
-    plots["performance_vs_epoch"] = plt.gcf()
-
-    if show_plots:
-        plt.show()
-    else:
-        plt.close()
-
-    # Plot 2: Best AUPRC for each N
-    plt.figure(figsize=(10, 6))
-    plt.plot(
-        cv_results_epoch["N"],
-        cv_results_epoch["auprc"],
-        "-o",
-        linewidth=2,
-        markersize=8,
-    )
-    plt.axvline(
-        x=best_n, color="red", linestyle="--", alpha=0.7, label=f"Best N={best_n}"
-    )
-    plt.xlabel("N (Expected particles per micrograph)", fontsize=12)
-    plt.ylabel("Best AUPRC", fontsize=12)
-    plt.title("Best Cross-validation Performance by N Value", fontsize=14)
-    plt.legend(fontsize=10)
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-
-    if save_plots:
-        plot_path = output_path / "cv_best_performance_by_n.png"
-        plt.savefig(plot_path, dpi=300, bbox_inches="tight")
-        print(f"Saved best performance plot: {plot_path}")
-
-    plots["best_performance_by_n"] = plt.gcf()
-
-    if show_plots:
-        plt.show()
-    else:
-        plt.close()
-
-    # Plot 3: Heatmap of AUPRC vs N and Epoch
-    plt.figure(figsize=(12, 8))
-
-    # Create pivot table for heatmap
-    heatmap_data = cv_results_mean.pivot(index="epoch", columns="N", values="auprc")
-
-    # Create heatmap
-    im = plt.imshow(heatmap_data.T, cmap="viridis", aspect="auto", origin="lower")
-    plt.colorbar(im, label="AUPRC")
-
-    # Set axis labels
-    plt.xlabel("Epoch", fontsize=12)
-    plt.ylabel("N Value", fontsize=12)
-    plt.title("AUPRC Heatmap: N vs Epoch", fontsize=14)
-
-    # Set tick labels
-    plt.xticks(range(len(heatmap_data.index)), heatmap_data.index)
-    plt.yticks(range(len(heatmap_data.columns)), heatmap_data.columns)
+        ax.set_xlabel("Epoch")
+        ax.set_ylabel("AUPRC")
+        ax.set_title("Cross-validation Performance: AUPRC vs Epoch")
+        ax.legend(loc="best")
+        ax.set_rasterization_zorder(0)
+        plots["performance_vs_epoch"] = perf_fig
+
+        # Plot 2: Best AUPRC for each N
+        best_fig = _new_figure(show_plots, figsize=(10, 6), tight_layout=True)
+        ax = best_fig.add_subplot()
+        ax.plot(
+            cv_results_epoch["N"],
+            cv_results_epoch["auprc"],
+            "-o",
+            linewidth=2,
+            markersize=8,
+            rasterized=True,
+        )
+        ax.axvline(
+            x=best_n, color="red", linestyle="--", alpha=0.7, label=f"Best N={best_n}"
+        )
+        ax.set_xlabel("N (Expected particles per micrograph)")
+        ax.set_ylabel("Best AUPRC")
+        ax.set_title("Best Cross-validation Performance by N Value")
+        ax.legend()
+        ax.set_rasterization_zorder(0)
+        plots["best_performance_by_n"] = best_fig
+
+        # Plot 3: Heatmap of AUPRC vs N and Epoch
+        heat_fig = _new_figure(show_plots, figsize=(12, 8), tight_layout=True)
+        ax = heat_fig.add_subplot()
+
+        # Create heatmap (pcolormesh draws one quad per cell, which is cheaper
+        # than resampling an image for a grid this small)
+        im = ax.pcolormesh(
+            np.arange(len(heatmap_data.index)),
+            np.arange(len(heatmap_data.columns)),
+            auprc_grid.T,
+            cmap="viridis",
+            shading="auto",
+            rasterized=True,
+        )
+        heat_fig.colorbar(im, ax=ax, label="AUPRC")
+        ax.grid(False)
+
+        # Set axis labels
+        ax.set_xlabel("Epoch")
+        ax.set_ylabel("N Value")
+        ax.set_title("AUPRC Heatmap: N vs Epoch")
+
+        # Set tick labels
+        ax.set_xticks(range(len(heatmap_data.index)), heatmap_data.index)
+        ax.set_yticks(range(len(heatmap_data.columns)), heatmap_data.columns)
+        plots["auprc_heatmap"] = heat_fig
+
+        if save_plots:
+            figures = (
+                (perf_fig, "cv_performance_vs_epoch.png", "performance plot"),
+                (best_fig, "cv_best_performance_by_n.png", "best performance plot"),
+                (heat_fig, "cv_auprc_heatmap.png", "heatmap"),
+            )
 
-    plt.tight_layout()
+            if save_png:
+                for fig, filename, label in figures:
+                    plot_path = output_path / filename
+                    fig.savefig(plot_path, dpi=300, bbox_inches="tight")
+                    print(f"Saved {label}: {plot_path}")
 
-    if save_plots:
-        plot_path = output_path / "cv_auprc_heatmap.png"
-        plt.savefig(plot_path, dpi=300, bbox_inches="tight")
-        print(f"Saved heatmap: {plot_path}")
+            if save_pdf:
+                # One document, so fonts are embedded once for every page
+                plot_path = output_path / "cv_analysis.pdf"
+                with PdfPages(plot_path) as pdf:
+                    for fig, _, _ in figures:
+                        pdf.savefig(fig, bbox_inches="tight")
+                print(f"Saved plot document: {plot_path}")
 
-    plots["auprc_heatmap"] = plt.gcf()
-
-    if show_plots:
-        plt.show()
-    else:
-        plt.close()
+        if show_plots:
+            plt.show()
 
     # Save results to CSV
     results_summary_path = output_path / "cv_analysis_summary.csv"
@@ -234,6 +765,14 @@ def analyze_cross_validation(
     cv_results_mean.to_csv(detailed_results_path, index=False)
     print(f"Saved detailed results: {detailed_results_path}")
 
+    # Also keep a Parquet copy, which is much smaller and faster to read back
+    if PYARROW_AVAILABLE:
+        detailed_parquet_path = detailed_results_path.with_suffix(".parquet")
+        cv_results_mean.to_parquet(
+            detailed_parquet_path, engine="pyarrow", compression="zstd", index=False
+        )
+        print(f"Saved detailed results: {detailed_parquet_path}")
+
     # Generate recommendations
     recommendations = {
         "best_n": best_n,
@@ -255,12 +794,19 @@ def analyze_cross_validation(
         f.write("Recommendation:\n")
         f.write(recommendations["recommendation"] + "\n\n")
         f.write("Detailed Results:\n")
-        f.write(cv_results_epoch.to_string())
+        f.write(cv_results_epoch[["N", "epoch", "auprc"]].to_string(index=False))
+        f.write("\n")
 
     print(f"Saved recommendations: {recommendations_path}")
 
-    return {
-        "cv_results": cv_results,
+    # Machine-readable copy with the full per-N results
+    recommendations_json_path = recommendations_path.with_suffix(".json")
+    with open(recommendations_json_path, "w") as f:
+        json.dump(recommendations, f, indent=2, default=_json_scalar)
+
+    print(f"Saved recommendations: {recommendations_json_path}")
+
+    results = {
         "cv_results_mean": cv_results_mean,
         "cv_results_epoch": cv_results_epoch,
         "best_n": best_n,
@@ -270,6 +816,18 @@ def analyze_cross_validation(
         "plots": plots,
         "output_dir": str(output_dir),
     }
+    if return_raw:
+        results["cv_results"] = cv_results
+    return results
+
+
+# (metric, label) for each panel of the training curves figure, in order
+_TRAINING_CURVE_PANELS = (
+    ("auprc", "AUPRC"),
+    ("loss", "Loss"),
+    ("precision", "Precision"),
+    ("recall", "Recall"),
+)
 
 
 def plot_training_curves(
@@ -294,68 +852,50 @@ def plot_training_curves(
     for file_path in training_files:
         try:
             # Load training data
-            data = pd.read_csv(file_path, sep="\t")
+            if PYARROW_AVAILABLE:
+                import pyarrow as pa
+                import pyarrow.csv as pacsv
+
+                data = pacsv.read_csv(
+                    file_path,
+                    parse_options=pacsv.ParseOptions(delimiter="\t"),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={"epoch": pa.int32()}, null_values=["-"]
+                    ),
+                ).to_pandas(split_blocks=True)
+            else:
+                data = pd.read_csv(file_path, sep="\t")
 
             # Extract model name from file path
             model_name = Path(file_path).stem
 
             # Create training curves plot
-            plt.figure(figsize=(12, 8))
+            fig = _new_figure(show_plots, figsize=(12, 8))
 
             # Plot training and validation metrics
-            if "train_auprc" in data.columns and "test_auprc" in data.columns:
-                plt.subplot(2, 2, 1)
-                plt.plot(data["epoch"], data["train_auprc"], label="Train AUPRC")
-                plt.plot(data["epoch"], data["test_auprc"], label="Test AUPRC")
-                plt.xlabel("Epoch")
-                plt.ylabel("AUPRC")
-                plt.title(f"{model_name} - AUPRC")
-                plt.legend()
-                plt.grid(True, alpha=0.3)
-
-            if "train_loss" in data.columns and "test_loss" in data.columns:
-                plt.subplot(2, 2, 2)
-                plt.plot(data["epoch"], data["train_loss"], label="Train Loss")
-                plt.plot(data["epoch"], data["test_loss"], label="Test Loss")
-                plt.xlabel("Epoch")
-                plt.ylabel("Loss")
-                plt.title(f"{model_name} - Loss")
-                plt.legend()
-                plt.grid(True, alpha=0.3)
-
-            if "train_precision" in data.columns and "test_precision" in data.columns:
-                plt.subplot(2, 2, 3)
-                plt.plot(
-                    data["epoch"], data["train_precision"], label="Train Precision"
-                )
-                plt.plot(data["epoch"], data["test_precision"], label="Test Precision")
-                plt.xlabel("Epoch")
-                plt.ylabel("Precision")
-                plt.title(f"{model_name} - Precision")
-                plt.legend()
-                plt.grid(True, alpha=0.3)
-
-            if "train_recall" in data.columns and "test_recall" in data.columns:
-                plt.subplot(2, 2, 4)
-                plt.plot(data["epoch"], data["train_recall"], label="Train Recall")
-                plt.plot(data["epoch"], data["test_recall"], label="Test Recall")
-                plt.xlabel("Epoch")
-                plt.ylabel("Recall")
-                plt.title(f"{model_name} - Recall")
-                plt.legend()
-                plt.grid(True, alpha=0.3)
-
-            plt.tight_layout()
+            for position, (metric, label) in enumerate(_TRAINING_CURVE_PANELS, 1):
+                train_column = f"train_{metric}"
+                test_column = f"test_{metric}"
+                if train_column not in data.columns or test_column not in data.columns:
+                    continue
+                ax = fig.add_subplot(2, 2, position)
+                ax.plot(data["epoch"], data[train_column], label=f"Train {label}")
+                ax.plot(data["epoch"], data[test_column], label=f"Test {label}")
+                ax.set_xlabel("Epoch")
+                ax.set_ylabel(label)
+                ax.set_title(f"{model_name} - {label}")
+                ax.legend()
+                ax.grid(True, alpha=0.3)
+
+            fig.tight_layout()
 
             if save_plots:
                 plot_path = output_path / f"{model_name}_training_curves.png"
-                plt.savefig(plot_path, dpi=300, bbox_inches="tight")
+                fig.savefig(plot_path, dpi=300, bbox_inches="tight")
                 print(f"Saved training curves: {plot_path}")
 
             if show_plots:
                 plt.show()
-            else:
-                plt.close()
 
         except Exception as e:
             print(f"Warning: Could not plot training curves for {file_path}: {e}")
@@ -387,6 +927,37 @@ def main():
         print("Please run cross-validation first using the 'topaz cross' command.")
 
 
+def _run_streaming(cmd: List[str], log_path: Path) -> None:
+    """
+    Run a command, echoing its output to the console and a log file as it runs.
+
+    stdout and stderr are merged and read line by line, so memory use stays
+    constant however long the command runs.
+
+    Args:
+        cmd: Command and arguments to execute
+        log_path: File that receives a copy of the output
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits with a non-zero status
+    """
+    import subprocess
+
+    with open(log_path, "w") as log, subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+    ) as process:
+        for line in process.stdout:
+            print(line, end="")
+            log.write(line)
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+
 def run_denoising_workflow(
         movies_dir: str,
         output_dir: str,
@@ -418,7 +989,6 @@ def run_denoising_workflow(
         )
     """
     import subprocess
-    import mrcfile
 
     # Setup paths
     output_path = Path(output_dir)
@@ -444,36 +1014,24 @@ def run_denoising_workflow(
     if not movie_paths:
         raise ValueError(f"No .mrc files found in {movies_dir}")
 
-    for movie_path in movie_paths:
-        name = movie_path.name
-
-        try:
-            # Load the movie frames
-            with mrcfile.open(movie_path, mode='r') as mrc:
-                frames = mrc.data
-
-            print(f"Processing: {name} (shape: {frames.shape})")
-
-            # Split and sum frames
-            if len(frames.shape) == 3:
-                odd_mic = frames[::2].sum(axis=0)  # Sum odd frames
-                even_mic = frames[1::2].sum(axis=0)  # Sum even frames
-            else:
-                print(f"Warning: {name} is not a 3D movie stack, skipping")
+    # Each movie is independent, so split them in parallel worker processes
+    workers = min(len(movie_paths), os.cpu_count() or 1)
+    chunksize = max(1, len(movie_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for name, shape, split, error in executor.map(
+                _split_one_movie,
+                movie_paths,
+                repeat(part_a_dir),
+                repeat(part_b_dir),
+                chunksize=chunksize,
+        ):
+            if error is not None:
+                print(f"Warning: Error processing {name}: {error}")
                 continue
 
-            # Save the split micrographs
-            odd_path = part_a_dir / name
-            with mrcfile.new(odd_path, overwrite=True) as mrc:
-                mrc.set_data(odd_mic[np.newaxis, ...])
-
-            even_path = part_b_dir / name
-            with mrcfile.new(even_path, overwrite=True) as mrc:
-                mrc.set_data(even_mic[np.newaxis, ...])
-
-        except Exception as e:
-            print(f"Warning: Error processing {name}: {e}")
-            continue
+            print(f"Processing: {name} (shape: {shape})")
+            if not split:
+                print(f"Warning: {name} is not a 3D movie stack, skipping")
 
     print(f"Training data created in: {training_data_dir}")
 
@@ -490,18 +1048,14 @@ def run_denoising_workflow(
 
     print(f"Training command: {' '.join(train_cmd)}")
 
+    train_log = models_dir / "train.log"
     try:
-        result = subprocess.run(
-            train_cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        _run_streaming(train_cmd, train_log)
         print("Training completed successfully")
-        print(f"Training output: {result.stdout}")
+        print(f"Training output saved to: {train_log}")
     except subprocess.CalledProcessError as e:
         print(f"Training failed: {e}")
-        print(f"Error output: {e.stderr}")
+        print(f"See the training log for details: {train_log}")
         raise
 
     # Step 3: Apply the trained model to denoise micrographs
@@ -535,24 +1089,88 @@ def run_denoising_workflow(
 
     print(f"Denoising command: {' '.join(denoise_cmd)}")
 
+    denoise_log = denoised_dir / "denoise.log"
     try:
-        result = subprocess.run(
-            denoise_cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        _run_streaming(denoise_cmd, denoise_log)
         print("Denoising completed successfully")
         print(f"Denoised micrographs saved to: {denoised_dir}")
     except subprocess.CalledProcessError as e:
         print(f"Denoising failed: {e}")
-        print(f"Error output: {e.stderr}")
+        print(f"See the denoising log for details: {denoise_log}")
         raise
 
     print(f"\nDenoising workflow completed successfully!")
     print(f"Results saved to: {denoised_dir}")
 
 
+def _mean_std(mic: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and standard deviation of a micrograph.
+
+    With numba installed both are computed from a single pass over the data
+    instead of one pass each for mean() and std().
+
+    Args:
+        mic: Micrograph to summarize
+
+    Returns:
+        Tuple of (mean, standard deviation)
+    """
+    # numba only handles native byte order; MRC files may be big-endian
+    if NUMBA_AVAILABLE and mic.dtype.isnative and mic.size:
+        total, total_sq = _accumulate_moments(np.asarray(mic).ravel())
+        mean = total / mic.size
+        return mean, float(np.sqrt(max(total_sq / mic.size - mean * mean, 0.0)))
+    return float(mic.mean()), float(mic.std())
+
+
+def _scale_for_display(mic: np.ndarray, mu: float, std: float) -> np.ndarray:
+    """
+    Standardize a micrograph and clip it to the [-4, 4] display range.
+
+    Works in a single float32 buffer instead of allocating a temporary for
+    every arithmetic step.
+
+    Args:
+        mic: Micrograph to scale
+        mu: Mean to subtract
+        std: Standard deviation to divide by
+
+    Returns:
+        Scaled and clipped float32 copy of mic
+    """
+    buf = np.empty(mic.shape, dtype=np.float32)
+    np.subtract(mic, mu, out=buf, dtype=np.float32)
+    np.multiply(buf, np.float32(1.0 / std), out=buf)
+    np.clip(buf, -4.0, 4.0, out=buf)
+    return buf
+
+
+def _fit_to_pixels(mic: np.ndarray, max_pixels: int) -> Tuple[np.ndarray, int]:
+    """
+    Block-average a micrograph so its larger side fits within max_pixels.
+
+    Rows and columns left over after dividing by the block size are dropped.
+
+    Args:
+        mic: Micrograph to downsample (the last two axes are the image)
+        max_pixels: Largest number of pixels wanted along either side
+
+    Returns:
+        Tuple of (downsampled micrograph, block size); the block size is 1
+        and mic is returned unchanged when it already fits
+    """
+    block = max(1, max(mic.shape[-2:]) // max_pixels)
+    if block == 1:
+        return mic, 1
+    height = mic.shape[-2] // block * block
+    width = mic.shape[-1] // block * block
+    blocks = mic[..., :height, :width].reshape(
+        *mic.shape[:-2], height // block, block, width // block, block
+    )
+    return blocks.mean(axis=(-3, -1), dtype=np.float32), block
+
+
 def visualize_denoising_results(
         raw_dir: str,
         denoised_dir: str,
@@ -613,38 +1231,57 @@ def visualize_denoising_results(
     print(f"Visualizing: {example_name}")
 
     try:
-        # Load the raw micrograph
-        with mrcfile.open(raw_file, mode='r') as mrc:
-            mic_raw = np.array(mrc.data, copy=False)
-
-        # Load the denoised micrograph
-        with mrcfile.open(denoised_file, mode='r') as mrc:
-            mic_dn = np.array(mrc.data, copy=False)
-
-        # Scale them for visualization
-        mu = mic_dn.mean()
-        std = mic_dn.std()
-
-        mic_raw_scaled = (mic_raw - mu) / std
-        mic_dn_scaled = (mic_dn - mu) / std
+        # Memory-map the raw and denoised micrographs; they only need to stay
+        # mapped until the scaled display copies have been made
+        with mrcfile.mmap(raw_file, mode='r', permissive=True) as mrc_raw, \
+                mrcfile.mmap(denoised_file, mode='r', permissive=True) as mrc_dn:
+            mic_raw = mrc_raw.data
+            mic_dn = mrc_dn.data
+
+            # Scale them for visualization
+            mu, std = _mean_std(mic_dn)
+
+            mic_raw_scaled = _scale_for_display(mic_raw, mu, std)
+            mic_dn_scaled = _scale_for_display(mic_dn, mu, std)
+
+        # The full view cannot show more pixels than the saved image has, so
+        # block-average down to that size while keeping pixel coordinates on
+        # the axes
+        mic_raw_view, block = _fit_to_pixels(mic_raw_scaled, 4000)
+        mic_dn_view, _ = _fit_to_pixels(mic_dn_scaled, 4000)
+        height, width = (size * block for size in mic_raw_view.shape[-2:])
+        extent = (-0.5, width - 0.5, height - 0.5, -0.5)
 
         # Create full micrograph comparison
         fig, ax = plt.subplots(1, 2, figsize=(24, 12))
 
-        im1 = ax[0].imshow(mic_raw_scaled, vmin=-4, vmax=4, cmap='Greys_r')
+        im1 = ax[0].imshow(
+            mic_raw_view,
+            vmin=-4,
+            vmax=4,
+            cmap='Greys_r',
+            extent=extent,
+        )
         ax[0].set_title(f'Raw Micrograph: {example_name}')
         ax[0].set_xlabel('X (pixels)')
         ax[0].set_ylabel('Y (pixels)')
-        plt.colorbar(im1, ax=ax[0])
-
-        im2 = ax[1].imshow(mic_dn_scaled, vmin=-4, vmax=4, cmap='Greys_r')
+        fig.colorbar(im1, ax=ax[0])
+
+        im2 = ax[1].imshow(
+            mic_dn_view,
+            vmin=-4,
+            vmax=4,
+            cmap='Greys_r',
+            extent=extent,
+        )
         ax[1].set_title(f'Denoised Micrograph: {example_name}')
         ax[1].set_xlabel('X (pixels)')
         ax[1].set_ylabel('Y (pixels)')
-        plt.colorbar(im2, ax=ax[1])
+        fig.colorbar(im2, ax=ax[1])
 
-        plt.tight_layout()
-        plt.savefig(output_path / f"{example_name}_comparison.png", dpi=300, bbox_inches="tight")
+        fig.tight_layout()
+        fig.savefig(output_path / f"{example_name}_comparison.png", dpi=300, bbox_inches="tight")
+        plt.close(fig)
         print(f"Saved full comparison: {output_path / f'{example_name}_comparison.png'}")
 
         # Create detailed crop comparison if crop region specified
@@ -657,20 +1294,19 @@ def visualize_denoising_results(
             ax[0].set_title(f'Raw Micrograph (Crop): {example_name}')
             ax[0].set_xlabel('X (pixels)')
             ax[0].set_ylabel('Y (pixels)')
-            plt.colorbar(im1, ax=ax[0])
+            fig.colorbar(im1, ax=ax[0])
 
             im2 = ax[1].imshow(mic_dn_scaled[y1:y2, x1:x2], vmin=-4, vmax=4, cmap='Greys_r')
             ax[1].set_title(f'Denoised Micrograph (Crop): {example_name}')
             ax[1].set_xlabel('X (pixels)')
             ax[1].set_ylabel('Y (pixels)')
-            plt.colorbar(im2, ax=ax[1])
+            fig.colorbar(im2, ax=ax[1])
 
-            plt.tight_layout()
-            plt.savefig(output_path / f"{example_name}_crop_comparison.png", dpi=300, bbox_inches="tight")
+            fig.tight_layout()
+            fig.savefig(output_path / f"{example_name}_crop_comparison.png", dpi=300, bbox_inches="tight")
+            plt.close(fig)
             print(f"Saved crop comparison: {output_path / f'{example_name}_crop_comparison.png'}")
 
-        plt.close('all')
-
     except Exception as e:
         print(f"Error visualizing {example_name}: {e}")
 